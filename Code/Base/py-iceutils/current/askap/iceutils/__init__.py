@@ -22,6 +22,7 @@
 #
 """Utilities to simplify ZeroC Ice application creation and deployment in the
 ASKAPsoft environment"""
+from __future__ import print_function
 __all__ = ["Server", "IceSession", "get_service_object", "get_communicator",
            "IceService", "add_monitoring"]
 import sys
@@ -72,7 +73,7 @@ def get_service_object(communicator, name, prx, retries=25):
                 Ice.ConnectionRefusedException,
                 Ice.NoEndpointException,
                 ) as ex:
-            print i, ":",ex
+            print(i, ":", ex)
 #            pass
         time.sleep(0.5)
         i +=1
@@ -23,7 +23,7 @@
 """
 This module contains wrappers to start up and administer IceGrid.
 """
-from __future__ import with_statement
+from __future__ import with_statement, print_function
 import os
 import sys
 import shutil
@@ -80,8 +80,8 @@ class IceGridSession(object):
                              shell=True)
         o, e = p.communicate()
         if p.returncode == 0:
-            print >> sys.stderr, "Warning: Found existing icegridnode process. " \
-                                 "Shutting it down."
+            print("Warning: Found existing icegridnode process. "
+                  "Shutting it down.", file=sys.stderr)
             time.sleep(1)
 
     def init_ice(self):
@@ -225,7 +225,7 @@ class IceGridSession(object):
 """ % (appname, stdpath, stdpath)
         with open(tmpname, 'w') as tmpexe:
             tmpexe.write(txt)
-        os.chmod(tmpname, 0755)
+        os.chmod(tmpname, 0o755)
         return [os.path.abspath(tmpname), os.path.abspath(tmpxmlname)]
 
     def get_application_names(self):
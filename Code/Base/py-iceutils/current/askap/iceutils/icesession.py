@@ -21,6 +21,7 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA.
 #
+from __future__ import print_function
 import sys
 import os
 import time
@@ -105,7 +106,7 @@ class IceSession(object):
             if os.path.exists(d) and self.cleanup:
                 shutil.rmtree(d)
             if not os.path.exists(d):
-                print "creating ice metadata directory", d
+                print("creating ice metadata directory", d)
                 os.makedirs(d)
                 self._clean_dirs.append(d)
 
@@ -115,9 +116,9 @@ class IceSession(object):
             try:
                 proc.terminate()
                 proc.wait()
-                print >> sys.stdout, "SIGTERM", proc.application
+                print("SIGTERM", proc.application, file=sys.stdout)
             except Exception as ex:
-                print >> sys.stderr, ex
+                print(ex, file=sys.stderr)
 
         self.processes = []
         self.wake_up.set()
@@ -168,8 +169,8 @@ class IceSession(object):
             if application == "icegridregistry":
                 self.wait_for_registry()
             if proc.poll() is not None:
-                print >> sys.stderr, proc.application, "failed:"
-                print >> sys.stderr, open(proc.log, 'r').read()
+                print(proc.application, "failed:", file=sys.stderr)
+                print(open(proc.log, 'r').read(), file=sys.stderr)
                 raise RuntimeError("Application '%s' failed on start"
                                    % application)
 
@@ -224,10 +225,10 @@ class IceSession(object):
             return
         try:
             for application, args in self.apps:
-                print "Starting", application, "...",
+                print("Starting", application, "...", end=" ")
                 sys.stdout.flush()
                 self.run_app(application, args)
-                print "done."
+                print("done.")
             self._started = True
         except KeyboardInterrupt:
             # need to wait here otherwise the processes won't terminate???
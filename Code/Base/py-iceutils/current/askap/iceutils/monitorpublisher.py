@@ -20,6 +20,7 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA.
 #
+from __future__ import print_function
 __all__ = ["get_monitor", "MonitorData"]
 
 import sys
@@ -123,7 +124,7 @@ class Monitoring(object):
                 try:
                     self._publisher.publish(point, t)
                 except Exception as ex:
-                    print ex
+                    print(ex)
                     # reinsert 
                     if retries > 5:
                         self.error = "Repeatedly unable to send monitoring data"
@@ -33,7 +33,7 @@ import Ice
 from askap.slice import FCMService
 import askap.interfaces.fcm
 
-from askap.parset import parset_to_dict
+from askap.parset import parset_file_to_dict
 
 # noinspection PyUnresolvedReferences
 from askap import logging
@@ -125,6 +125,11 @@ class Server(object):
         """Control configuration via FCM/command-line (default `True`)"""
         self.fcm = None
         """the FCM service via :obj:`FCMWrapper`"""
+        self._config_key = None
+        self.min_retry_delay = 0.05
+        """Initial delay in seconds between :meth:`wait_for_service` retries"""
+        self.max_retry_delay = 5.0
+        """Maximum delay in seconds between :meth:`wait_for_service` retries"""
 
     def set_retries(self, retries):
         """
@@ -135,7 +140,8 @@ class Server(object):
     def get_config(self):
         """
         Set up FCM configuration from either given file in command-line arg or
-        the FCM
+        the FCM. A local config file is only re-parsed if it has changed since
+        the last call.
         :return:
         """
         if not self.configurable:
@@ -145,8 +151,12 @@ class Server(object):
             if arg.startswith(key):
                 k, v = arg.split("=")
                 p = os.path.expanduser(os.path.expandvars(v))
-                self.parameters = parset_to_dict(open(p).read())
-                self.logger.info("Initialized from local config '%s'" % p)
+                config_key = (p, os.path.getmtime(p))
+                if config_key == self._config_key:
+                    return
+                self.parameters = parset_file_to_dict(p)
+                self._config_key = config_key
+                self.logger.info("Initialized from local config '%s'", p)
                 self.fcm = FileFCMService(self.parameters)
                 self.logger.debug("Created dummy FCM service")
                 return
@@ -171,14 +181,20 @@ class Server(object):
     def wait_for_service(self, servicename, callback, *args):
         """
         Try to connect to the registry and establish connection to the given
-        Ice service
+        Ice service. Retries back off exponentially from
+        :attr:`min_retry_delay` to :attr:`max_retry_delay` seconds. If
+        `retries` was given, give up after `retries` times
+        :attr:`max_retry_delay` seconds.
         :param servicename:
         :param callback:
         :param args:
         :return:
         """
         retval = None
-        delay = 5.0
+        delay = self.min_retry_delay
+        deadline = None
+        if self._retries > -1:
+            deadline = time.time() + self._retries * self.max_retry_delay
         count = 0
         registry = False
         while not registry:
@@ -190,23 +206,21 @@ class Server(object):
                     Ice.NotRegisteredException,
                     Ice.ConnectFailedException,
                     Ice.DNSException) as ex:
-                if self._retries > -1 and self._retries == count:
+                if deadline is not None and time.time() > deadline:
                     msg = "Couldn't connect to {0}: ".format(servicename)
                     self.logger.error(msg+str(ex))
                     raise TimeoutError(msg)
                 if count < 10:
-                    print >> sys.stderr, "Waiting for", servicename
+                    self.logger.info("Waiting for %s", servicename)
                 if count == 10:
-                    print >> sys.stderr, "Repeated 10+ times"
-                    self.logger.warn("Waiting for {0}".format(servicename))
+                    self.logger.warn("Waiting for %s, repeated 10+ times",
+                                     servicename)
                 registry = False
                 count += 1
                 time.sleep(delay)
+                delay = min(delay * 2, self.max_retry_delay)
         if registry:
-            self.logger.info("Connected to {0}".format(servicename))
-            # DC: this adds a lot of noise to functional test output.
-            # Surely in production the log message is sufficient?
-            # print >> sys.stderr, servicename, "found"
+            self.logger.info("Connected to %s", servicename)
         return retval
 
     def _create_adapter(self, name, endpoints=None):
@@ -241,8 +255,7 @@ class Server(object):
         self.initialize_services()
 
         for service in self._services:
-            self._adapter.add(service['value'],
-                              self._comm.stringToIdentity(service['name']))
+            self._adapter.add(service['value'], service['identity'])
 
         self.wait_for_service("registry", self._adapter.activate)
 
@@ -266,7 +279,9 @@ class Server(object):
         :param value: the implemnation of the interface to provide
 
         """
-        self._services.append({'name': name, 'value': value})
+        self._services.append(
+            {'name': name, 'value': value,
+             'identity': self._comm.stringToIdentity(name)})
 
     # noinspection PyMethodMayBeStatic
     def initialize_services(self):
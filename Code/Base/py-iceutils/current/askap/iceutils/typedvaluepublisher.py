@@ -104,9 +104,9 @@ if __name__ == "__main__":
                 'test': 1+1j,
                 'test2': 1.0,
                 }
-    bat = 1000L
+    bat = 1000
     mpub = TimeTaggedTypedValuePublisher()
-    for i in range(3L):
+    for i in range(3):
         mpub.publish(testdict, bat+i*5)
         if i < 2:
             time.sleep(5)
@@ -20,6 +20,7 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA.
 #
+from __future__ import print_function
 __all__ = ["TypedValueMapper", "TimeTaggedTypedValueMapper",
            "typed_mapper", "dict_mapper"]
 
@@ -67,7 +68,7 @@ class TypedValueMapper(object):
             'test': 1+1j,
             'test2': 1.0,
             }
-            print mapper(d)
+            print(mapper(d))
 
     """
     def __init__(self):
@@ -183,5 +184,5 @@ if __name__ == "__main__":
          'test3': None,
          }
     tvm = typed_mapper(d)
-    print dict_mapper(tvm)
-    print d
+    print(dict_mapper(tvm))
+    print(d)
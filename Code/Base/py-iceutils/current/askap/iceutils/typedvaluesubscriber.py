@@ -19,6 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA
+from __future__ import print_function
 __all__ = ["TypedValueSubscriber"]
 
 import time
@@ -37,7 +38,7 @@ class DefaultTypeValueMapImpl(ITimeTaggedTypedValueMapPublisher):
         self._kwargs = kwargs
 
     def publish(self, data, current=None):
-        print data
+        print(data)
 
 class TypedValueSubscriber(object):
     """IceStorm subscriber to TypedValue based topics"""
@@ -59,5 +59,6 @@ logger = logging.getLogger(__name__)
 
 from askap.parset.parset import (ParameterSet, decode, encode, extract, 
                                  to_dict, merge, 
-                                 parset_to_dict, dict_to_parset, slice_parset,
+                                 parset_to_dict, parset_file_to_dict,
+                                 dict_to_parset, slice_parset,
                                  sub_parset)
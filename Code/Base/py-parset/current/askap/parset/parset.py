@@ -25,8 +25,8 @@ import re
 import warnings
 import ast
 
-__all__ = ["ParameterSet", "dict_to_parset", "parset_to_dict", "slice_parset",
-           "sub_parset", "merge"]
+__all__ = ["ParameterSet", "dict_to_parset", "parset_to_dict",
+           "parset_file_to_dict", "slice_parset", "sub_parset", "merge"]
 
 
 def to_dict(parmap):
@@ -48,10 +48,9 @@ def sub_parset(d, key):
                 for k, v in d.items() if k.startswith(key))
 
 
-def parset_to_dict(st, raw=False):
-    """Turn a parameterset string into a python `dict`"""
+def _lines_to_dict(lines, raw=False):
     d = {}
-    for line in st.splitlines():
+    for line in lines:
         pval, comm = extract(line)
         if pval:
             val = raw and pval[1] or decode(pval[1])
@@ -59,6 +58,18 @@ def parset_to_dict(st, raw=False):
     return d
 
 
+def parset_to_dict(st, raw=False):
+    """Turn a parameterset string into a python `dict`"""
+    return _lines_to_dict(st.splitlines(), raw)
+
+
+def parset_file_to_dict(filename, raw=False):
+    """Turn a parameterset file into a python `dict`. The file is parsed
+    line by line without reading it into memory first."""
+    with open(filename) as pfile:
+        return _lines_to_dict(pfile, raw)
+
+
 def dict_to_parset(d, sort=False):
     """Turn a python `dict` into a parameterset string.
 
@@ -21,7 +21,8 @@
 # Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307 USA.
 #
 import os
-from askap.parset import ParameterSet, decode, encode, merge
+from askap.parset import ParameterSet, decode, encode, merge, \
+    parset_to_dict, parset_file_to_dict
 from nose.tools import raises, assert_equals
 
 
@@ -43,6 +44,13 @@ def test_fileconstructor():
     p = ParameterSet(testfile)
 
 
+def test_parset_file_to_dict():
+    testfile = os.path.join(os.path.split(__file__)[0], 'example.parset')
+    with open(testfile) as f:
+        expected = parset_to_dict(f.read())
+    assert_equals(parset_file_to_dict(testfile), expected)
+
+
 # from file
 def test_dictconstructor():
     p1 = ParameterSet({'x.y': 1})
@@ -10,11 +10,6 @@
 #  so that we can produce nice plots showing how well the source list
 #  matches the reference list.
 
-from pkg_resources import require
-require('numpy')
-require('matplotlib')
-from pylab import *
-from numpy import *
 from askap.analysis.evaluation.modelcomponents import *
 import logging
 
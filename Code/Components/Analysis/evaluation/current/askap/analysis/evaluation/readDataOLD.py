@@ -10,11 +10,62 @@
 #  so that we can produce nice plots showing how well the source list
 #  matches the reference list.
 
-from pkg_resources import require
-require('numpy')
-require('matplotlib')
-from pylab import *
-from numpy import *
+import numpy as np
+# pandas has a faster tokenizer, but is not a hard dependency
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# Column layouts of the "matches.txt" and "misses.txt" files. Only the
+# columns that are returned to the caller are read. String columns are
+# object fields so that IDs of any length are kept intact.
+_match_cols = (0,1,2,3,4,5,6,7,10,11,12,13,14,15,16,18,19,20,21,22,23,24)
+_match_dtype = np.dtype([('type',int),('idS',object),
+                         ('xS',float),('yS',float),('fS',float),
+                         ('aS',float),('bS',float),('pS',float),
+                         ('chisq',float),('imagerms',float),('rms',float),
+                         ('nfree',int),('ndof',int),('npixfit',int),('npixobj',int),
+                         ('idR',object),
+                         ('xR',float),('yR',float),('fR',float),
+                         ('aR',float),('bR',float),('pR',float)])
+
+_miss_cols = (0,1,2,3,4,8,9,10,11,12,13,14)
+_miss_dtype = np.dtype([('type',object),('id',object),
+                        ('x',float),('y',float),('f',float),
+                        ('chisq',float),('imagerms',float),('rms',float),
+                        ('nfree',int),('ndof',int),('npixfit',int),('npixobj',int)])
+
+## @ingroup plotting
+#    Reads the requested whitespace-separated columns of a file, using
+#    the pandas C parser when it is available and numpy.loadtxt
+#    otherwise. Both return the same array types: object arrays of
+#    strings for object fields, and the field's dtype otherwise.
+#    @param filename The file to read the data from
+#    @param dtype Structured dtype giving the name and type of each column
+#    @param usecols Indices (ascending) of the columns to read
+#    @return A dictionary mapping column name to a numpy array
+def _read_columns(filename, dtype, usecols):
+    if pd is not None:
+        types = dict((col, str if dtype[i].kind == 'O' else dtype[i])
+                     for i, col in enumerate(usecols))
+        try:
+            df = pd.read_csv(filename, sep=r'\s+', header=None, usecols=list(usecols),
+                             dtype=types, na_filter=False, engine='c')
+        except pd.errors.EmptyDataError:
+            # read_csv rejects empty files; loadtxt returns empty arrays
+            pass
+        else:
+            return dict((name, df[col].values.astype(dtype[name]))
+                        for name, col in zip(dtype.names, usecols))
+
+    # loadtxt cannot fill object fields of a structured array, so read all
+    # columns as strings in one pass (the width is taken from the longest
+    # value, so nothing is truncated) and convert each column afterwards
+    strs = np.loadtxt(filename, dtype=str, usecols=usecols, ndmin=2)
+    strs = strs.reshape(-1, len(usecols))
+    return dict((name, strs[:, i].astype(dtype[name]))
+                for i, name in enumerate(dtype.names))
 
 #############################################################################
 
@@ -37,71 +88,9 @@ def read_match_data(filename=None):
     Usage:
     type,idS,xS,yS,fS,aS,bS,pS,chisq,imagerms,fitrms,ndof,npf,npo,idR,xR,yR,fR,aR,bR,pR = read_match_data("matches.txt")
     """
-    type=[]
-    idS=[]
-    xS=[]
-    yS=[]
-    fS=[]
-    aS=[]
-    bS=[]
-    pS=[]
-    alphaS=[]
-    betaS=[]
-    chisq=[]
-    imagerms=[]
-    rms=[]
-    nfree=[]
-    ndof=[]
-    npixfit=[]
-    npixobj=[]
-    dudflux=[]
-    idR=[]
-    xR=[]
-    yR=[]
-    fR=[]
-    aR=[]
-    bR=[]
-    pR=[]
-    alphaR=[]
-    betaR=[]
-    sep=[]
-    absFdiff=[]
-    relFdiff=[]
-    for line in open(filename):
-        fields = line.split()
-        type.append(fields[0])
-        idS.append(fields[1])
-        xS.append(fields[2])
-        yS.append(fields[3])
-        fS.append(fields[4])
-        aS.append(fields[5])
-        bS.append(fields[6])
-        pS.append(fields[7])
-	alphaS.append(fields[8])
-	betaS.append(fields[9])
-        chisq.append(fields[10])
-        imagerms.append(fields[11])
-        rms.append(fields[12])
-        nfree.append(fields[13])
-        ndof.append(fields[14])
-        npixfit.append(fields[15])
-        npixobj.append(fields[16])
-        dudflux.append(fields[17])
-        idR.append(fields[18])
-        xR.append(fields[19])
-        yR.append(fields[20])
-        fR.append(fields[21])
-        aR.append(fields[22])
-        bR.append(fields[23])
-        pR.append(fields[24])
-	alphaR.append(fields[25])
-	betaR.append(fields[26])
-	sep.append(fields[27])
-	absFdiff.append(fields[28])
-	relFdiff.append(fields[29])
-
-    
-    return cast[int](array(type)),idS,cast[float](array(xS)),cast[float](array(yS)),cast[float](array(fS)),cast[float](array(aS)),cast[float](array(bS)),cast[float](array(pS)),cast[float](array(chisq)),cast[float](array(imagerms)),cast[float](array(rms)),cast[int](array(nfree)),cast[int](array(ndof)),cast[int](array(npixfit)),cast[int](array(npixobj)),idR,cast[float](array(xR)),cast[float](array(yR)),cast[float](array(fR)),cast[float](array(aR)),cast[float](array(bR)),cast[float](array(pR))
+    data = _read_columns(filename, _match_dtype, _match_cols)
+
+    return data['type'],data['idS'].tolist(),data['xS'],data['yS'],data['fS'],data['aS'],data['bS'],data['pS'],data['chisq'],data['imagerms'],data['rms'],data['nfree'],data['ndof'],data['npixfit'],data['npixobj'],data['idR'].tolist(),data['xR'],data['yR'],data['fR'],data['aR'],data['bR'],data['pR']
 
 #############################################################################
 
@@ -121,42 +110,9 @@ def read_miss_data(filename=None):
     Usage:
         type,id,x,y,f,chisq,imagerms,fitrms,ndof,npf,npo = read_miss_data("misses.txt")
     """
-    type=[]
-    id=[]
-    x=[]
-    y=[]
-    f=[]
-    aS=[]
-    bS=[]
-    pS=[]
-    chisq=[]
-    imagerms=[]
-    rms=[]
-    nfree=[]
-    ndof=[]
-    npixfit=[]
-    npixobj=[]
-    dudflux=[]
-    for line in open(filename):
-        fields = line.split()
-        type.append(fields[0])
-        id.append(fields[1])
-        x.append(fields[2])
-        y.append(fields[3])
-        f.append(fields[4])
-        aS.append(fields[5])
-        bS.append(fields[6])
-        pS.append(fields[7])
-        chisq.append(fields[8])
-        imagerms.append(fields[9])
-        rms.append(fields[10])
-        nfree.append(fields[11])
-        ndof.append(fields[12])
-        npixfit.append(fields[13])
-        npixobj.append(fields[14])
-        dudflux.append(fields[15])
-    
-    return array(type),array(id),cast[float](array(x)),cast[float](array(y)),cast[float](array(f)),cast[float](array(chisq)),cast[float](array(imagerms)),cast[float](array(rms)),cast[int](array(nfree)),cast[int](array(ndof)),cast[int](array(npixfit)),cast[int](array(npixobj))
+    data = _read_columns(filename, _miss_dtype, _miss_cols)
+
+    return data['type'],data['id'],data['x'],data['y'],data['f'],data['chisq'],data['imagerms'],data['rms'],data['nfree'],data['ndof'],data['npixfit'],data['npixobj']
 
 
 def read_ref_list(filename=None):
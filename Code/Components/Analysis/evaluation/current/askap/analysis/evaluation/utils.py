@@ -3,10 +3,6 @@
 ## @file
 # A file containing utility functions to help with the plotting.
 
-from pkg_resources import require
-require('numpy')
-require('matplotlib')
-from pylab import *
 import numpy as np
 import gc
 
@@ -18,7 +14,7 @@ def posToDec(pos):
 
 def dmsToDec(pos):
     bits=pos.split(':')
-    return (abs(float(bits[0]))+float(bits[1])/60.+float(bits[2])/3600.)*sign(float(bits[0]))
+    return (abs(float(bits[0]))+float(bits[1])/60.+float(bits[2])/3600.)*np.sign(float(bits[0]))
 
 ## @ingroup plotting
 # @param array The array of values
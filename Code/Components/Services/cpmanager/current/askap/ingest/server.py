@@ -1,4 +1,6 @@
 import Ice, IceStorm
+import threading
+from multiprocessing.pool import ThreadPool
 
 from askap.iceutils import Server
 
@@ -8,6 +10,8 @@ from ObsService import CPObsServiceImp
 from svcclients import IngestMonitor
 from JIRAStateChangeMonitor import JIRAStateChangeMonitor
 
+TOPIC_MANAGER = 'IceStorm/TopicManager@IceStorm.TopicManager'
+
 
 class IngestManager(Server):
     def __init__(self, comm):
@@ -15,6 +19,8 @@ class IngestManager(Server):
         self._monitor = None
         self.logger = logger
         self.monitoring = True
+        self._topic_manager_prx = comm.stringToProxy(TOPIC_MANAGER)
+        self._startup_failed = threading.Event()
 
     def initialize_services(self):
         logger.debug('initialize_services')
@@ -22,18 +28,45 @@ class IngestManager(Server):
         cp_obsServer = CPObsServiceImp(self.fcm)
         self.add_service("CentralProcessorService", cp_obsServer)
 
+        # The ingest monitor and the IceStorm subscription both wait on
+        # other services, so set them up concurrently. get() re-raises any
+        # exception so that a failure still aborts startup. If the monitor
+        # fails, the IceStorm wait is told to give up so the pool can be
+        # joined.
+        pool = ThreadPool(2)
+        try:
+            monitor = pool.apply_async(self._start_ingest_monitor,
+                                       (cp_obsServer,))
+            subscription = pool.apply_async(self._subscribe_sbstate_changes)
+            try:
+                monitor.get()
+            except Exception:
+                self._startup_failed.set()
+                raise
+            subscription.get()
+        finally:
+            pool.close()
+            pool.join()
+
+        logger.debug('initialize_services finished')
+
+    def _topic_manager_cast(self, prx):
+        # raising a non-Ice exception ends the wait_for_service retry loop
+        if self._startup_failed.is_set():
+            raise RuntimeError("Startup failed, no longer waiting for IceStorm")
+        return IceStorm.TopicManagerPrx.checkedCast(prx)
+
+    def _start_ingest_monitor(self, cp_obsServer):
         ingest_monitor = IngestMonitor(self._comm, self.parameters, cp_obsServer)
         ingest_monitor.start()
 
+    def _subscribe_sbstate_changes(self):
         topicname = "sbstatechange"
-        prx = self._comm.stringToProxy(
-            'IceStorm/TopicManager@IceStorm.TopicManager')
-
         logger.debug('Connected to topic manager')
 
         manager = self.wait_for_service("IceStorm",
-                                        IceStorm.TopicManagerPrx.checkedCast,
-                                        prx)
+                                        self._topic_manager_cast,
+                                        self._topic_manager_prx)
 
         try:
             topic = manager.retrieve(topicname)
@@ -51,6 +84,3 @@ class IngestManager(Server):
 
         except:
             raise RuntimeError("ICE adapter initialisation failed")
-
-
-        logger.debug('initialize_services finished')
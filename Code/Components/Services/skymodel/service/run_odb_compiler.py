@@ -5,6 +5,7 @@
 # database schema files in ./schema or ./schema_definitions have changed.  The
 # odb-generated files in ./datamodel should be added to source control.
 
+import concurrent.futures
 import glob
 import os
 import pprint
@@ -17,6 +18,12 @@ thirdparty_dir = os.path.expandvars('$ASKAP_ROOT/3rdParty/')
 odb_base_dir = os.path.join(thirdparty_dir, 'odb/odb-2.4.0')
 odb_output_dir = os.path.abspath('./datamodel')
 
+def run_command(cmd):
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    output = process.communicate()[0].decode()
+    return process.returncode, output
+
+
 # Set up the custom build step for generating the ODB persistence code from our
 # data model
 def run_odb_compiler():
@@ -71,10 +78,9 @@ def run_odb_compiler():
         '--profile', 'boost/date-time/posix-time',
         ]
 
-    # append the list of sources
+    # find the list of sources
     sources = glob.glob(os.path.join(schema_dir, "*.h"))
     schema_sources = glob.glob(os.path.join(schema_dir, "*.i"))
-    cmd.extend(sources)
 
     if not os.path.exists(odb_output_dir):
         os.mkdir(odb_output_dir)
@@ -86,21 +92,23 @@ def run_odb_compiler():
         dst = os.path.join(odb_output_dir, os.path.basename(src))
         shutil.copy(src, dst)
 
-    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-    while True:
-        nextline = process.stdout.readline().decode()
-        if nextline == '' and process.poll() is not None:
-            break
-        sys.stdout.write(nextline)
-        sys.stdout.flush()
-
-    output = process.communicate()[0].decode()
-    exitCode = process.returncode
-
-    if (exitCode == 0):
-        return output
-    else:
-        raise OSError(cmd, exitCode, output)
+    # odb compiles each header independently, so run one compiler per header
+    # in parallel. The output of each is printed once it has finished.
+    outputs = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = dict((executor.submit(run_command, cmd + [src]), cmd + [src])
+                       for src in sources)
+        for future in concurrent.futures.as_completed(futures):
+            exitCode, output = future.result()
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            if exitCode != 0:
+                for f in futures:
+                    f.cancel()
+                raise OSError(futures[future], exitCode, output)
+            outputs.append(output)
+
+    return ''.join(outputs)
 
 
 if __name__ == '__main__':
@@ -5,10 +5,16 @@ It also generates the Ice DTO objects from the same definitions.
 
 Requirements:
     * Python 3
-    * Pandas >= 0.18 (older versions do not work)
-    * xlrd (used by Pandas for reading Excel files)
+    * Pandas >= 0.21 (older versions do not work)
+    * openpyxl (used by Pandas for reading Excel files)
+
+Parsed spreadsheets are cached in ./.cache and only re-read when the
+spreadsheet file changes.
 '''
 
+import glob
+import hashlib
+import os
 import pandas as pd
 from string import Template
 
@@ -16,7 +22,7 @@ from string import Template
 # Each schema file defines a dictionary with the following keys:
 # * **input**: the input spreadsheet
 # * **output**: the output file
-# * **parse_cols**: zero-based column indicies for parsing from the spreadsheet
+# * **usecols**: zero-based column indicies for parsing from the spreadsheet
 # * **skiprows**: zero-based row indicies that should be skipped in the spreadsheet
 
 # The mapping from database types to C++ types
@@ -47,6 +53,10 @@ SLICE_TYPE_MAP = {
 I4 = '    '
 I8 = '        '
 
+# A single rendered field: the (already joined) comment, pragma and
+# definition lines, followed by a blank line
+FIELD_TEMPLATE = '{indent}{lines}\n\n'
+
 COMMON_FILE_HEADER = '''\
 /// ----------------------------------------------------------------------------
 /// This file is generated by schema_definitions/generate.py.
@@ -343,6 +353,7 @@ QUERY_BUILDER_FOOTER = '''
 #------------------------------------------------------------
 # Configuration
 #------------------------------------------------------------
+CACHE_DIR = './.cache'
 CONTINUUM_COMPONENT_SPEC = './GSM_casda.continuum_component_description.xlsx'
 POLARISATION_SPEC = './GSM_casda_polarisation.xlsx'
 
@@ -350,19 +361,19 @@ FILES = [
     {
         'input': CONTINUUM_COMPONENT_SPEC,
         'output': '../schema/ContinuumComponent.i',
-        'parse_cols': None,
+        'usecols': None,
         'skiprows': [0],
     },
     {
         'input': POLARISATION_SPEC,
         'output': '../schema/Polarisation.i',
-        'parse_cols': None,
+        'usecols': None,
         'skiprows': [0],
     },
     {
         'input': './GSM_data_source_description.xlsx',
         'output': '../schema/DataSource.i',
-        'parse_cols': None,
+        'usecols': None,
         'skiprows': [0],
     },
 ]
@@ -374,7 +385,7 @@ SLICE_FILES = [
     {
         'input': POLARISATION_SPEC,
         'output': '../SkyModelServiceDTO.ice',
-        'parse_cols': None,
+        'usecols': None,
         'skiprows': [0],
         'file_header': POLARISATION_HEADER,
         'file_footer': '    };',
@@ -383,7 +394,7 @@ SLICE_FILES = [
     {
         'input': CONTINUUM_COMPONENT_SPEC,
         'output': '../SkyModelServiceDTO.ice',
-        'parse_cols': None,
+        'usecols': None,
         'skiprows': [0],
         'file_header': CONTINUUM_COMPONENT_HEADER,
         'file_footer': SLICE_FOOTER,
@@ -395,10 +406,49 @@ SLICE_FILES = [
 #------------------------------------------------------------
 # Utility functions
 #------------------------------------------------------------
+def read_spreadsheet(filename, sheet_name, usecols, skiprows, converters):
+    """Read a spreadsheet, reusing the cached data frame if the file has not
+    changed since it was last read"""
+    stat = os.stat(filename)
+    key = hashlib.sha1('{0}:{1}:{2}:{3}:{4}:{5}'.format(
+        stat.st_mtime_ns,
+        stat.st_size,
+        sheet_name,
+        usecols,
+        skiprows,
+        sorted((k, getattr(v, '__name__', repr(v))) for k, v in converters.items())
+        ).encode()).hexdigest()
+    basename = os.path.basename(filename)
+    cache_file = os.path.join(CACHE_DIR, '{0}.{1}.pkl'.format(basename, key))
+
+    if os.path.exists(cache_file):
+        try:
+            return pd.read_pickle(cache_file)
+        except Exception as e:
+            # e.g. truncated, or written by a different pandas version
+            print('\tIgnoring unreadable cache file {0}: {1}'.format(cache_file, e))
+
+    data = pd.read_excel(
+        filename,
+        sheet_name=sheet_name,
+        converters=converters,
+        usecols=usecols,
+        skiprows=skiprows,
+        engine='openpyxl')
+
+    # drop the cached copies of older versions of the spreadsheet
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    for stale in glob.glob(os.path.join(CACHE_DIR, glob.escape(basename) + '.*.pkl')):
+        if stale != cache_file:
+            os.remove(stale)
+    data.to_pickle(cache_file)
+    return data
+
+
 def load(
     filename,
-    sheetname='Catalogue description',
-    parse_cols=None,
+    sheet_name='Catalogue description',
+    usecols=None,
     skiprows=None,
     converters={
             'name': str,
@@ -415,12 +465,7 @@ def load(
             'negative_is_invalid': bool,
             }):
     """Load the table data from a CASDA definition spreadsheet"""
-    data = pd.read_excel(
-        filename,
-        sheetname=sheetname,
-        converters=converters,
-        parse_cols=parse_cols,
-        skiprows=skiprows)
+    data = read_spreadsheet(filename, sheet_name, usecols, skiprows, converters)
 
     # Drop any rows with missing data in the name or datatype columns
     data.dropna(subset=['name', 'datatype'], inplace=True)
@@ -428,7 +473,14 @@ def load(
     # fill any remaining missing data with empty strings
     data.fillna('', inplace=True)
 
-    return data[data.include_in_gsm == True]
+    data = data[data.include_in_gsm == True].copy()
+
+    # strip whitespace from the text columns in one go rather than per field
+    for column in ('name', 'description', 'datatype', 'units', 'ucd'):
+        if column in data:
+            data[column] = data[column].str.strip()
+
+    return data
 
 
 def to_camel_case(snake_str):
@@ -444,14 +496,14 @@ def to_camel_case(snake_str):
 class Field(object):
     "Represents a database field"
     def __init__(self, df_row, is_view, type_map, indent=0, camel_case=False):
-        self.name = df_row.name.strip()
+        self.name = df_row.name
         if camel_case:
             self.name = to_camel_case(self.name)
 
-        self.comment = df_row.description.strip()
-        self.raw_type = df_row.datatype.strip()
+        self.comment = df_row.description
+        self.raw_type = df_row.datatype
         self.dtype = type_map[self.raw_type]
-        self.units = df_row.units.strip()
+        self.units = df_row.units
         self.indexed = df_row.index
         self.nullable = df_row.nullable
         self.is_view = is_view
@@ -462,42 +514,33 @@ class Field(object):
         self.negative_is_invalid = df_row.negative_is_invalid
 
         # not every tablespec contains the ucd column
-        try:
-            self.ucd = df_row.ucd.strip()
-        except:
-            self.ucd = ''
+        self.ucd = getattr(df_row, 'ucd', '')
 
     def __repr__(self):
         return self.__str__()
 
     def __str__(self):
-        _str = self._comment()
+        lines = self._comment()
 
         if not self.is_view:
             # handle any pragmas for magic field names
-            if self.name in self._magic_names:
-                for pragma in self._magic_names[self.name]:
-                    _str.append(pragma)
+            lines.extend(self._magic_names.get(self.name, []))
 
             if self.indexed:
-                _str.append('#pragma db index')
+                lines.append('#pragma db index')
 
             if self.nullable:
-                _str.append('#pragma db null')
+                lines.append('#pragma db null')
             else:
-                _str.append('#pragma db not_null')
+                lines.append('#pragma db not_null')
 
         # the field definition
-        _str.append('{0} {1};'.format(
-            self.dtype,
-            self.name))
-
-        # indentation
-        _str = [self._indent * ' ' + line for line in _str]
-
-        _str.append('\n')
+        lines.append('{0} {1};'.format(self.dtype, self.name))
 
-        return '\n'.join(_str)
+        # indent every line and terminate the field with a blank line
+        return FIELD_TEMPLATE.format(
+            indent=self._indent * ' ',
+            lines=('\n' + self._indent * ' ').join(lines))
 
     def _comment(self):
         "Builds the comment text"
@@ -535,9 +578,10 @@ def write_output(
     with open(filename, mode) as out:
         if file_header:
             out.write(file_header)
-        for field in get_fields(data_frame, type_map, is_view, indent=indent, camel_case=camel_case):
-            if not is_view or (is_view and field.lsm_view):
-                out.write(str(field))
+        out.write(''.join(
+            str(field)
+            for field in get_fields(data_frame, type_map, is_view, indent=indent, camel_case=camel_case)
+            if not is_view or field.lsm_view))
         if file_footer:
             out.write(file_footer)
 
@@ -731,7 +775,7 @@ def generate_database_schema():
     for f in FILES:
         data = load(
             f['input'],
-            parse_cols=f['parse_cols'],
+            usecols=f['usecols'],
             skiprows=f['skiprows'])
         write_output(data, f['output'], TYPE_MAP)
 
@@ -740,7 +784,7 @@ def generate_ice_dto():
     for f in SLICE_FILES:
         data = load(
             f['input'],
-            parse_cols=f['parse_cols'],
+            usecols=f['usecols'],
             skiprows=f['skiprows'])
 
         write_output(
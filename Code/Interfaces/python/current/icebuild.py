@@ -48,6 +48,9 @@ class build_ice(Command):
         pkgdir = self.package.replace(".", os.path.sep)
         if not os.path.exists(pkgdir):
             raise IOError("Target package directory '%s' not found" % pkgdir)
+        if self._up_to_date(pkgdir):
+            self.announce("slice2py stubs are up to date", level=2)
+            return
         slicepy = os.path.join(self.dep.get_install_path("ice"),
                                "bin", "slice2py")
         os.system("%s %s --no-package --output-dir %s %s" \
@@ -63,6 +66,19 @@ class build_ice(Command):
                 f.write('from . import %s\n' % name)
                 f.write('Ice.updateModules()\n')
 
+    def _up_to_date(self, pkgdir):
+        """Check whether every interface has a generated stub which is newer
+        than all of the interface files"""
+        if not self.interfaces:
+            return False
+        newest = max(os.path.getmtime(s) for s in self.interfaces)
+        for slice in self.interfaces:
+            name = os.path.splitext(os.path.basename(slice))[0]
+            stub = os.path.join(pkgdir, name + "_ice.py")
+            if not os.path.exists(stub) or os.path.getmtime(stub) < newest:
+                return False
+        return True
+
 class clean_ice(rbuild_clean):
     def run(self):
         ice = []
@@ -39,7 +39,7 @@ build_py2.sub_commands.append(('build_ice', None))
 dep = Dependency()
 dep.add_package()
 
-slice_files = glob.glob('../../slice/current/*.ice')
+slice_files = sorted(glob.glob('../../slice/current/*.ice'))
 
 ROOTPKG = "askap"
 PKGNAME = "slice"
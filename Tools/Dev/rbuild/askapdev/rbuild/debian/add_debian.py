@@ -27,29 +27,84 @@ __all__ = ['add_debian']
 import os
 import stat
 import pkg_resources
+from multiprocessing.pool import ThreadPool
 from .. import utils
 from .naming import get_versioned_name
 
 A_ROOT = os.getenv("ASKAP_ROOT") 
 
-def add_debian(package):    
-    """Add a debian directory to the give package"""
-    odir = os.path.abspath(os.curdir)
+MAX_WORKERS = 8
+
+def add_debian(packages):
+    """Add a debian directory to the given package or list of packages.
+    The packages are set up concurrently and the new debian directories are
+    added to svn in a single command."""
+    if isinstance(packages, basestring):
+        packages = [packages]
+    # drop duplicates, which would otherwise race on creating the directory
+    seen = set()
+    packages = [p for p in packages if not (p in seen or seen.add(p))]
+    if len(packages) == 0:
+        return
+    pool = ThreadPool(min(MAX_WORKERS, len(packages)))
+    try:
+        results = pool.map(_try_create_debian, packages)
+    finally:
+        pool.close()
+        pool.join()
+    # print from this thread only, so that messages don't interleave
+    for debdir, notes, msg, error in results:
+        for note in notes:
+            print note
+    # add whatever was created even if another package failed, otherwise
+    # its debian directory would stay unversioned and be skipped next time
+    created = [(debdir, msg) for debdir, notes, msg, error in results
+               if debdir is not None]
+    if len(created) > 0:
+        o,e,rc = utils.runcmd("svn add %s" % " ".join(d for d, msg in created))
+        if rc != 0:
+            raise OSError(e)
+        for d, msg in created:
+            utils.q_print(msg)
+    for debdir, notes, msg, error in results:
+        if error is not None:
+            raise error
+
+
+def _try_create_debian(package):
+    """Run :func:`_create_debian`, returning any exception instead of raising
+    it. Returns a tuple of the created debian directory (or None), a list of
+    info/warning messages, the success message (or None) and the exception
+    (or None)."""
+    notes = []
+    try:
+        result = _create_debian(package, notes)
+    except Exception as ex:
+        return None, notes, None, ex
+    if result is None:
+        return None, notes, None, None
+    return result[0], notes, result[1], None
+
+
+def _create_debian(package, notes):
+    """Create the debian directory of a package. Returns the directory and an
+    info message, or None if nothing was created. Other messages are appended
+    to `notes`."""
     pdir = package
     if not pdir.startswith(os.sep):
         pdir = os.path.join(A_ROOT, pdir)
 
     debdir = os.path.join(pdir, "debian")
     if os.path.exists(debdir):
-        print "info:", package, "debianised already"
-        return
+        notes.append("info: %s debianised already" % package)
+        return None
     else:
         os.mkdir(debdir)
     name, version = get_versioned_name(package)
     if name is None or version is None:
-        print "warn: Can't determine debian package name or version for", \
-            package
-        return
+        notes.append("warn: Can't determine debian package name or version "
+                     "for %s" % package)
+        return None
     d = { 'package': name, 'version' : version }
     for f in pkg_resources.resource_listdir(__name__, 'data'):
         data = pkg_resources.resource_string(__name__, 
@@ -63,9 +118,6 @@ def add_debian(package):
         if "rules" == f:
             st = os.stat(debf)
             os.chmod(debf, st.st_mode | stat.S_IEXEC)
-    o,e,rc = utils.runcmd("svn add %s" % debdir)
-    if rc != 0:
-        raise OSError(e)
 
-    utils.q_print("info: Created debian package '%s (%s)' "
-                  "infrastructure for %s"  % (name, version, package))
+    return debdir, ("info: Created debian package '%s (%s)' "
+                    "infrastructure for %s"  % (name, version, package))
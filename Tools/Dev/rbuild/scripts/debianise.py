@@ -42,10 +42,12 @@ if __name__ == "__main__":
     deps = Dependency()
     deps.add_package()
     dep_list = [os.path.relpath(rdir, a_root) for rdir in deps.get_rootdirs()]
+    todo = []
     for dep in dep_list+[myself]:
         nodeb = os.path.join(a_root, dep, "NO_DEBIAN")
         if os.path.exists(nodeb):
             q_print("Ignoring package '{0}' which set to NO_DEBIAN".format(dep))
             continue
-        add_debian(dep)
-    
+        todo.append(dep)
+    add_debian(todo)
+
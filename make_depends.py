@@ -4,8 +4,8 @@ from json import load
 from glob import glob
 from os import path,environ
 from socket import gethostname
-from re import sub,match,search
 
+import re
 import sys,getopt
 
 depfile = "yanda_packages.json"
@@ -36,7 +36,7 @@ for opt,arg in opts:
 yanda_packages = load(open(depfile))
 # find the system ones
 for eachpackage in yanda_packages.keys():
-  if match("^ENV:",yanda_packages[eachpackage]):
+  if yanda_packages[eachpackage].startswith("ENV:"):
     print("Looking for system dependency " + eachpackage)
     var = yanda_packages[eachpackage].split(":")
     val = environ.get(var[1])
@@ -47,26 +47,30 @@ for eachpackage in yanda_packages.keys():
     else:
       print("Cannot find: " + var[1] + ", is this the correct variable")    
             
+# a single pattern matching a line that sets any of the packages
+package_pattern = re.compile("^(" + "|".join(map(re.escape, yanda_packages.keys())) + ")=")
+value_with_semicolon = re.compile(r'=\S+;')
+value = re.compile(r'=\S+')
+
+h = "." + gethostname()
 files=glob("**/dependencies." + system,recursive=True)
 for eachfile in files:
     print(eachfile)
     with open(eachfile,"r") as original:
-        h = "." + gethostname()
         root = path.splitext(eachfile)[0]
         p = root + h
         lines = original.readlines()
         with open(p,"w") as newfile:
           for line in lines:
-            matched=False
-            for eachpackage in yanda_packages.keys():
-              if match("^" + eachpackage+"=",line):
-                print("Found " + eachpackage + " in " + eachfile)
-                if search(";",line):
-                  newfile.write(sub(r'=\S+;', "=" + yanda_packages[eachpackage] + ";", line))
-                else:
-                  newfile.write(sub(r'=\S+',"=" + yanda_packages[eachpackage] ,line))
-                matched=True
-            if (matched == False):
+            found = package_pattern.match(line)
+            if found:
+              eachpackage = found.group(1)
+              print("Found " + eachpackage + " in " + eachfile)
+              if ";" in line:
+                newfile.write(value_with_semicolon.sub(lambda m: "=" + yanda_packages[eachpackage] + ";", line))
+              else:
+                newfile.write(value.sub(lambda m: "=" + yanda_packages[eachpackage], line))
+            else:
               newfile.write(line)
 
 # print(sub(r'/usr/local', yanda_packages[eachpackage], line))